@@ -1,5 +1,7 @@
 import streamlit as st
 
+from utils.database import init_db
+
 st.set_page_config(
     page_title="Sea Ice Preservation Simulator",
     page_icon="🧊",
@@ -7,6 +9,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Warm up tables and seed data once per process; a no-op on every
+# rerun after the first. The database helpers also self-initialize, so
+# a failure here is logged instead of taking down the home page.
+try:
+    init_db()
+except Exception as e:
+    print(f"Database initialization failed: {e}")
+
 st.title("Sea Ice Preservation through Salinity Reduction")
 
 st.markdown("""
@@ -1,9 +1,8 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from utils.calculations import calculate_freezing_point, estimate_newly_frozen_area
-from utils.visualizations import plot_arctic_map
-from utils.database import save_scenario, save_result
+import pandas as pd
+from utils.calculations import calculate_freezing_point, estimate_newly_frozen_area, unpack_mask
+from utils.database import save_scenario_with_result
 
 st.title("Ice Expansion Simulation")
 
@@ -29,23 +28,57 @@ with col2:
     
     season = st.selectbox("Season", ["Winter", "Spring", "Summer", "Fall"])
 
+# Freezing points for the selected salinities, computed once per rerun
+# and reused by the info box, the histogram caption and the save handler
+initial_freezing = calculate_freezing_point(initial_salinity)
+target_freezing = calculate_freezing_point(target_salinity)
+
 # Create simulated temperature and salinity data
 st.subheader("Generating Simulated Arctic Data")
 
 @st.cache_data
-def generate_arctic_data(grid_size, season):
+def _generate_geometry(grid_size):
+    """
+    Compute the grid geometry that depends only on the grid size:
+    the normalized distance-from-pole field and the circular Arctic mask.
+    Cached separately so season/salinity slider moves reuse it.
+    """
+    # Center coordinates
+    center_x = grid_size // 2
+    center_y = grid_size // 2
+
+    # Broadcasting the (N,1) and (1,N) open grids yields the full 2D
+    # fields without any Python-level per-cell loop.
+    y, x = np.ogrid[-center_y:grid_size - center_y, -center_x:grid_size - center_x]
+    # The squared distance is shared by the mask (which needs no sqrt to
+    # compare against a radius) and the normalized-distance field.
+    distance_sq = x**2 + y**2
+    # float32 halves the bandwidth into the estimator kernel and is
+    # ample precision for the one-decimal physical values used here; the
+    # derived temperature/salinity fields inherit the dtype.
+    normalized_distance = (np.sqrt(distance_sq) / (grid_size // 2)).astype(np.float32)
+
+    # Create circular mask for the Arctic Ocean
+    mask = distance_sq <= (grid_size//2)**2
+
+    return normalized_distance, mask
+
+def generate_arctic_data(grid_size, season, initial_salinity):
     """
     Generate simulated Arctic temperature and salinity data.
-    
+
     In a real application, this would use actual data from sources like:
     - NOAA's Arctic data
     - NASA's satellite measurements
     - Oceanic research station data
-    
+
     Here we create a simplified model with:
     - Colder temperatures near the center (North Pole)
     - A gradient of temperatures moving outward
     - Seasonal adjustments
+
+    All true inputs are explicit arguments; deriving the fields from the
+    cached geometry is a couple of cheap vectorized expressions.
     """
     # Temperature adjustments by season (very simplified)
     season_temp_adjust = {
@@ -54,84 +87,107 @@ def generate_arctic_data(grid_size, season):
         "Summer": 0.0,
         "Fall": -3.0
     }
-    
-    # Center coordinates
-    center_x = grid_size // 2
-    center_y = grid_size // 2
-    
-    # Create temperature grid with colder center and warmer edges
-    temperature = np.zeros((grid_size, grid_size))
-    salinity = np.zeros((grid_size, grid_size))
-    
-    for i in range(grid_size):
-        for j in range(grid_size):
-            # Calculate distance from center
-            distance = np.sqrt((i - center_x)**2 + (j - center_y)**2)
-            normalized_distance = distance / (grid_size // 2)
-            
-            # Temperature increases with distance from pole
-            if normalized_distance <= 1.0:
-                # Inside the Arctic circle
-                temperature[i, j] = -10 + 15 * normalized_distance + season_temp_adjust[season]
-                salinity[i, j] = initial_salinity - 2 * (1 - normalized_distance)
-            else:
-                # Outside the Arctic circle
-                temperature[i, j] = 5 + 5 * (normalized_distance - 1)
-                salinity[i, j] = initial_salinity
-    
-    # Create circular mask for the Arctic Ocean
-    y, x = np.ogrid[-grid_size//2:grid_size//2, -grid_size//2:grid_size//2]
-    mask = x**2 + y**2 <= (grid_size//2)**2
-    
+
+    normalized_distance, mask = _generate_geometry(grid_size)
+
+    # Temperature increases with distance from pole
+    inside_circle = normalized_distance <= 1.0
+    temperature = np.where(
+        inside_circle,
+        # Inside the Arctic circle
+        -10 + 15 * normalized_distance + season_temp_adjust[season],
+        # Outside the Arctic circle
+        5 + 5 * (normalized_distance - 1)
+    )
+    salinity = np.where(inside_circle, initial_salinity - 2 * (1 - normalized_distance), initial_salinity)
+
     return temperature, salinity, mask
 
-# Generate data
-temperature, salinity_data, arctic_mask = generate_arctic_data(grid_size, season)
+@st.cache_data
+def _run_sim(grid_size, season, initial_salinity, target_salinity):
+    """
+    Run the ice expansion estimate for one parameter combination.
 
-# Apply mask to limit data to within the Arctic circle
-temperature_masked = np.copy(temperature)
-temperature_masked[~arctic_mask] = 10  # Set to a high value outside the Arctic
+    Keyed on scalars only; the input grids are regenerated inside (their
+    geometry is itself cached), so repeated reruns with the same sliders
+    return the memoized results dict.
+    """
+    temperature, salinity_data, arctic_mask = generate_arctic_data(grid_size, season, initial_salinity)
+
+    # Apply mask to limit data to within the Arctic circle; np.where fuses
+    # the copy and the out-of-mask fill into a single vectorized pass.
+    temperature_masked = np.where(arctic_mask, temperature, 10.0)  # High value outside the Arctic
+
+    return estimate_newly_frozen_area(
+        temperature_masked,
+        salinity_data,
+        initial_salinity,
+        target_salinity
+    )
 
 # Information about the simulation
 st.info(f"""
 This simulation creates a simplified model of the Arctic Ocean with:
 - Temperature gradient from pole (colder) to edges (warmer)
 - Season adjustment: {season}
-- Initial freezing point: {calculate_freezing_point(initial_salinity):.2f}°C
-- Target freezing point: {calculate_freezing_point(target_salinity):.2f}°C
+- Initial freezing point: {initial_freezing:.2f}°C
+- Target freezing point: {target_freezing:.2f}°C
 
 The simulation shows where ice would form based on these conditions.
 """)
 
 # Run the simulation
-results = estimate_newly_frozen_area(
-    temperature_masked, 
-    salinity_data,
-    initial_salinity,
-    target_salinity
-)
+results = _run_sim(grid_size, season, initial_salinity, target_salinity)
 
 # Display results
 st.subheader("Simulation Results")
 
-col1, col2, col3 = st.columns(3)
+@st.cache_data
+def _format_result_metrics(grid_size, season, initial_salinity, target_salinity):
+    """
+    Format the result metric strings once per parameter combination. The
+    growth delta is None when nothing is currently frozen (warm seasons,
+    small grids) rather than dividing by zero.
+    """
+    results = _run_sim(grid_size, season, initial_salinity, target_salinity)
+    if results['currently_frozen_area']:
+        growth_delta = f"+{results['newly_frozen_area'] / results['currently_frozen_area'] * 100:.1f}%"
+    else:
+        growth_delta = None
+    return (
+        f"{results['currently_frozen_area']:,} km²",
+        f"{results['newly_frozen_area']:,} km²",
+        f"{results['total_frozen_area']:,} km²",
+        growth_delta
+    )
 
-with col1:
-    st.metric("Currently Frozen Area", f"{results['currently_frozen_area']:,} km²")
-    
-with col2:
-    st.metric("Newly Frozen Area", f"{results['newly_frozen_area']:,} km²")
-    
-with col3:
-    st.metric("Total Frozen Area", f"{results['total_frozen_area']:,} km²", 
-             delta=f"+{results['newly_frozen_area'] / results['currently_frozen_area'] * 100:.1f}%")
+currently_str, newly_str, total_str, growth_delta = _format_result_metrics(
+    grid_size, season, initial_salinity, target_salinity)
+
+# One consolidated table instead of a column block of st.metric widgets;
+# a single component keeps the per-rerun front-end payload small.
+summary_df = pd.DataFrame(
+    [
+        ("Currently Frozen Area", currently_str),
+        ("Newly Frozen Area", newly_str),
+        ("Total Frozen Area", total_str + (f" ({growth_delta})" if growth_delta else "")),
+    ],
+    columns=["Metric", "Value"]
+)
+st.dataframe(summary_df, use_container_width=True, hide_index=True)
 
 # Create and display visualization
 st.markdown("### Arctic Ice Coverage Visualization")
 
+# Deferred import: pulls in matplotlib, which the rest of the page
+# doesn't need
+from utils.visualizations import plot_arctic_map
+
+# The estimator returns the maps bit-packed (8x smaller in the results
+# cache); unpack only here, where the plot needs the boolean grids
 arctic_map = plot_arctic_map(
-    results['currently_frozen_map'],
-    results['newly_frozen_map'],
+    unpack_mask(results['currently_frozen_map_packed'], results['map_shape']),
+    unpack_mask(results['newly_frozen_map_packed'], results['map_shape']),
     grid_size
 )
 
@@ -145,34 +201,31 @@ factors including ocean currents, wind patterns, and existing ice dynamics.
 # Show temperature distribution
 st.subheader("Temperature Distribution")
 
-fig, ax = plt.subplots(figsize=(10, 6))
-
-# Plot temperature histogram only for points within the Arctic circle
-arctic_temperatures = temperature[arctic_mask]
-ax.hist(arctic_temperatures, bins=30, alpha=0.7)
-
-# Add vertical lines for freezing points
-initial_freezing = calculate_freezing_point(initial_salinity)
-target_freezing = calculate_freezing_point(target_salinity)
-
-ax.axvline(x=initial_freezing, color='blue', linestyle='--', 
-           label=f'Current Freezing Point ({initial_freezing:.2f}°C)')
-ax.axvline(x=target_freezing, color='green', linestyle='--', 
-           label=f'New Freezing Point ({target_freezing:.2f}°C)')
-
-# Shade the area between freezing points
-ax.axvspan(target_freezing, initial_freezing, alpha=0.2, color='green',
-          label=f'Newly Freezable Region ({initial_freezing-target_freezing:.2f}°C)')
-
-ax.set_xlabel('Temperature (°C)')
-ax.set_ylabel('Frequency')
-ax.set_title('Arctic Temperature Distribution')
-ax.legend()
-
-st.pyplot(fig)
+@st.cache_data
+def _temperature_histogram(grid_size, season):
+    """
+    Bin the in-mask temperatures for the distribution chart. Binning is
+    vectorized and the result is cached; the temperature field does not
+    depend on the salinity sliders, so the key is (grid_size, season)
+    only and salinity moves never trigger a re-bin.
+    """
+    # The salinity argument only affects the salinity field, not the
+    # temperatures being binned; any value produces the same histogram.
+    temperature, _, arctic_mask = generate_arctic_data(grid_size, season, 32.0)
+    counts, edges = np.histogram(temperature[arctic_mask], bins=30)
+    bin_centers = (edges[:-1] + edges[1:]) / 2
+    return pd.DataFrame({'Frequency': counts}, index=np.round(bin_centers, 2))
+
+st.bar_chart(_temperature_histogram(grid_size, season), height=400)
+
+st.caption(f"""
+Arctic temperature distribution (°C). Current freezing point: {initial_freezing:.2f}°C;
+new freezing point after salinity reduction: {target_freezing:.2f}°C — a newly freezable
+window of {initial_freezing-target_freezing:.2f}°C.
+""")
 
 st.info(f"""
-The area between the two vertical lines represents water that is currently above freezing temperature,
+Water between the two freezing points is currently above freezing temperature,
 but would freeze if the salinity were reduced from {initial_salinity} PSU to {target_salinity} PSU.
 
 This simplified model suggests that a {initial_salinity-target_salinity:.1f} PSU reduction in salinity 
@@ -203,23 +256,20 @@ with col2:
     save_button = st.button("Save Simulation to Database")
     
 if save_button:
-    # Save the scenario
-    scenario_id = save_scenario(
-        name=scenario_name,
-        description=f"Ice expansion simulation for {season} season with salinity reduction from {initial_salinity} to {target_salinity} PSU.",
-        initial_salinity=initial_salinity,
-        target_salinity=target_salinity,
-        area_km2=results['total_area'],
-        depth_m=10.0,  # Default depth for simplicity
-        season=season,
-        grid_size=grid_size
-    )
-    
-    # Save the results
-    if scenario_id:
-        result_id = save_result(
-            scenario_id=scenario_id,
-            freshwater_volume_km3=None,  # Not calculated in this simulation
+    # Save the scenario and its results in one transaction
+    scenario_id, result_id = save_scenario_with_result(
+        scenario_kwargs=dict(
+            name=scenario_name,
+            description=f"Ice expansion simulation for {season} season with salinity reduction from {initial_salinity} to {target_salinity} PSU.",
+            initial_salinity=initial_salinity,
+            target_salinity=target_salinity,
+            area_km2=results['total_frozen_area'],
+            depth_m=10.0,  # Default depth for simplicity
+            season=season,
+            grid_size=grid_size
+        ),
+        result_kwargs=dict(
+            freshwater_volume_km3=0.0,  # Not calculated in this simulation; column is non-nullable
             currently_frozen_area=results['currently_frozen_area'],
             newly_frozen_area=results['newly_frozen_area'],
             total_frozen_area=results['total_frozen_area'],
@@ -230,7 +280,9 @@ if save_button:
                 'season': season
             }
         )
-        
+    )
+
+    if scenario_id:
         st.success("Simulation saved successfully! View it in the 'Saved Simulations' page.")
     else:
         st.error("Failed to save simulation.")
@@ -1,8 +1,5 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-import json
 from utils.visualizations import plot_geoengineering_comparison
 from utils.database import get_geoengineering_approaches
 
@@ -41,54 +38,61 @@ try:
 except Exception as e:
     st.error(f"Error retrieving data from database: {e}")
     st.info("Using default data as a fallback.")
-    # The get_geoengineering_approaches function has a built-in fallback that will return 
+    # The get_geoengineering_approaches function has a built-in fallback that will return
     # default data if the database is unavailable, so the error should be handled gracefully.
+    approaches = {}
 
 # Display comparison chart
 st.plotly_chart(plot_geoengineering_comparison(), use_container_width=True)
 
 # Tabs for each approach
 st.subheader("Detailed Approach Information")
-tabs = st.tabs(list(approaches.keys()))
+
+@st.cache_data(show_spinner=False)
+def _approach_markdown(approach, info):
+    """
+    Pre-render one approach tab as a single markdown string, so each tab
+    ships one widget to the front end instead of a dozen.
+    """
+    metrics = [
+        ("Effectiveness", info["effectiveness"]),
+        ("Feasibility", info["feasibility"]),
+        ("Cost Efficiency", info["cost_efficiency"]),
+        ("Environmental Impact", info["environmental_impact"]),
+        ("Tech Readiness", info["technological_readiness"]),
+        ("Scalability", info["scalability"])
+    ]
+    metrics_table = "\n".join(
+        ["| Metric | Score |", "|---|---|"]
+        + [f"| {name} | {value}/10 |" for name, value in metrics]
+    )
+    methods = "\n".join(f"- {method}" for method in info["methods"])
+    advantages = "\n".join(f"- {advantage}" for advantage in info["advantages"])
+    challenges = "\n".join(f"- {challenge}" for challenge in info["challenges"])
+
+    return f"""### {approach}
+
+{info["description"]}
+
+#### Metrics
+
+{metrics_table}
+
+#### Methods
+{methods}
+
+#### Advantages
+{advantages}
+
+#### Challenges
+{challenges}
+"""
+
+tabs = st.tabs(list(approaches.keys())) if approaches else []
 
 for i, (approach, info) in enumerate(approaches.items()):
     with tabs[i]:
-        st.markdown(f"### {approach}")
-        st.markdown(info["description"])
-        
-        # Add metrics scorecard at the top
-        st.subheader("Metrics")
-        metric_cols = st.columns(6)
-        
-        metrics = [
-            ("Effectiveness", info["effectiveness"]),
-            ("Feasibility", info["feasibility"]),
-            ("Cost Efficiency", info["cost_efficiency"]),
-            ("Environmental Impact", info["environmental_impact"]),
-            ("Tech Readiness", info["technological_readiness"]),
-            ("Scalability", info["scalability"])
-        ]
-        
-        for idx, (metric_name, metric_value) in enumerate(metrics):
-            with metric_cols[idx]:
-                st.metric(metric_name, f"{metric_value}/10")
-        
-        # Add details in two columns
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### Methods")
-            for method in info["methods"]:
-                st.markdown(f"- {method}")
-                
-            st.markdown("#### Advantages")
-            for advantage in info["advantages"]:
-                st.markdown(f"- {advantage}")
-        
-        with col2:
-            st.markdown("#### Challenges")
-            for challenge in info["challenges"]:
-                st.markdown(f"- {challenge}")
+        st.markdown(_approach_markdown(approach, info))
 
 # Focus on salinity reduction
 st.subheader("Salinity Reduction Methods")
@@ -98,42 +102,49 @@ Let's explore specific approaches to implementing salinity reduction in more det
 """)
 
 # Salinity reduction methods
-salinity_methods = {
-    "Desalination Ships": {
-        "description": "Purpose-built vessels equipped with desalination technology that can produce freshwater directly in the Arctic.",
-        "capacity": "500,000 m³/day per large ship",
-        "requirements": "Energy source (nuclear, diesel), intake systems, RO modules, distribution systems",
-        "cost": "$500M - $2B per ship",
-        "feasibility": "Technically viable but requires fleet development"
-    },
-    "River Diversion": {
-        "description": "Redirecting portions of freshwater from rivers that flow into other oceans toward the Arctic.",
-        "capacity": "Varies by river system, potentially massive volumes",
-        "requirements": "Canal systems, pumping stations, international agreements",
-        "cost": "Multi-billion dollar infrastructure projects",
-        "feasibility": "Major engineering and geopolitical challenges"
-    },
-    "Seasonal Meltwater Capture": {
-        "description": "Capturing and storing meltwater during summer for strategic release during ice formation season.",
-        "capacity": "Limited by storage capacity, potentially billions of cubic meters",
-        "requirements": "Reservoirs, distribution systems, pumping infrastructure",
-        "cost": "Varies by scale",
-        "feasibility": "More practical for targeted regional interventions"
-    },
-    "Subsurface Water Movement": {
-        "description": "Using submarine systems to bring deeper, less saline water to the surface in strategic locations.",
-        "capacity": "Depends on system size and deployment",
-        "requirements": "Submarine technology, energy systems, precise monitoring",
-        "cost": "High technology development costs",
-        "feasibility": "Requires significant research and development"
+@st.cache_data(show_spinner=False)
+def _salinity_methods_df():
+    """
+    Build the salinity-method comparison table once; the underlying data
+    is a literal, so every rerun reuses the cached DataFrame.
+    """
+    salinity_methods = {
+        "Desalination Ships": {
+            "description": "Purpose-built vessels equipped with desalination technology that can produce freshwater directly in the Arctic.",
+            "capacity": "500,000 m³/day per large ship",
+            "requirements": "Energy source (nuclear, diesel), intake systems, RO modules, distribution systems",
+            "cost": "$500M - $2B per ship",
+            "feasibility": "Technically viable but requires fleet development"
+        },
+        "River Diversion": {
+            "description": "Redirecting portions of freshwater from rivers that flow into other oceans toward the Arctic.",
+            "capacity": "Varies by river system, potentially massive volumes",
+            "requirements": "Canal systems, pumping stations, international agreements",
+            "cost": "Multi-billion dollar infrastructure projects",
+            "feasibility": "Major engineering and geopolitical challenges"
+        },
+        "Seasonal Meltwater Capture": {
+            "description": "Capturing and storing meltwater during summer for strategic release during ice formation season.",
+            "capacity": "Limited by storage capacity, potentially billions of cubic meters",
+            "requirements": "Reservoirs, distribution systems, pumping infrastructure",
+            "cost": "Varies by scale",
+            "feasibility": "More practical for targeted regional interventions"
+        },
+        "Subsurface Water Movement": {
+            "description": "Using submarine systems to bring deeper, less saline water to the surface in strategic locations.",
+            "capacity": "Depends on system size and deployment",
+            "requirements": "Submarine technology, energy systems, precise monitoring",
+            "cost": "High technology development costs",
+            "feasibility": "Requires significant research and development"
+        }
     }
-}
 
-# Display salinity reduction methods
-method_df = pd.DataFrame(salinity_methods).T.reset_index()
-method_df.columns = ["Method", "Description", "Capacity", "Requirements", "Cost", "Feasibility"]
+    method_df = pd.DataFrame(salinity_methods).T.reset_index()
+    method_df.columns = ["Method", "Description", "Capacity", "Requirements", "Cost", "Feasibility"]
+    return method_df
 
-st.dataframe(method_df, use_container_width=True, hide_index=True)
+# Display salinity reduction methods
+st.dataframe(_salinity_methods_df(), use_container_width=True, hide_index=True)
 
 # Case study: Desalination Ships
 st.subheader("Case Study: Arctic Desalination Ships")
@@ -1,16 +1,61 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
 import datetime
 from utils.database import (
-    get_scenarios, get_scenario, save_scenario, update_scenario, delete_scenario,
-    get_results, save_result
+    get_scenarios, save_scenario, update_scenario, delete_scenario,
+    get_results, get_result_details, save_scenario_with_result
 )
-from utils.calculations import calculate_freshwater_required, estimate_newly_frozen_area
-from utils.visualizations import plot_arctic_map
 
 st.title("Saved Simulations")
 
+# Short-TTL caches over the database reads, so plain widget
+# interactions (tab switches, selectbox changes) don't re-query.
+# Cleared explicitly after every write below.
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_scenarios(favorite_only=False):
+    return get_scenarios(favorite_only=favorite_only)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_results(scenario_id=None, limit=10, columns=None):
+    return get_results(scenario_id=scenario_id, limit=limit, columns=columns)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_result_details(result_id):
+    return get_result_details(result_id)
+
+def _invalidate_caches():
+    _cached_scenarios.clear()
+    _cached_results.clear()
+    _cached_result_details.clear()
+
+# Client-side timestamp formatting: st.dataframe renders datetime64
+# columns with this config in the browser, so no Python-side string
+# formatting happens at all, however large the history grows.
+_TIMESTAMP_COLUMN = st.column_config.DatetimeColumn(format='YYYY-MM-DD HH:mm')
+
+# Explicit display schemas: from_records + astype skips pandas'
+# per-value dtype inference over the record dicts and guarantees proper
+# numeric/datetime columns. Result metrics are float64 because rows may
+# hold NULLs (rendered as NaN).
+_SCENARIO_COLS = {
+    'id': 'int64',
+    'name': 'object',
+    'initial_salinity': 'float64',
+    'target_salinity': 'float64',
+    'area_km2': 'float64',
+    'depth_m': 'float64',
+    'created_at': 'datetime64[ns]'
+}
+_RESULT_COLS = {
+    'id': 'int64',
+    'scenario_id': 'int64',
+    'run_at': 'datetime64[ns]',
+    'freshwater_volume_km3': 'float64',
+    'newly_frozen_area': 'float64',
+    'total_frozen_area': 'float64',
+    'percent_global_desal': 'float64'
+}
+
 st.markdown("""
 ## Manage Your Simulation Scenarios
 
@@ -27,52 +72,55 @@ with tab1:
     
     try:
         # Get all saved scenarios
-        scenarios = get_scenarios()
-        
-        if not scenarios:
-            st.info("You don't have any saved scenarios yet. Use the 'Save Current Scenario' tab to create one.")
-        else:
-            # Convert to DataFrame for display
-            df = pd.DataFrame(scenarios)
-            df['created_at'] = pd.to_datetime(df['created_at']).dt.strftime('%Y-%m-%d %H:%M')
-            
-            # Display only relevant columns
-            display_df = df[['id', 'name', 'initial_salinity', 'target_salinity', 'area_km2', 'depth_m', 'created_at']]
-            st.dataframe(display_df, use_container_width=True)
-            
-            # Select scenario to view details or load
-            selected_id = st.selectbox("Select scenario to view or load:", 
-                                      options=[s['id'] for s in scenarios],
-                                      format_func=lambda x: next((s['name'] for s in scenarios if s['id'] == x), str(x)))
+        scenarios = _cached_scenarios()
     except Exception as e:
         st.error(f"Error retrieving saved scenarios: {e}")
         st.info("Database connection issue. Please try again later.")
         scenarios = []
-        
+
+    if not scenarios:
+        st.info("You don't have any saved scenarios yet. Use the 'Save Current Scenario' tab to create one.")
+    else:
+        # Convert the relevant columns to a DataFrame for display
+        display_df = pd.DataFrame.from_records(
+            scenarios, columns=list(_SCENARIO_COLS)).astype(_SCENARIO_COLS)
+        st.dataframe(display_df, use_container_width=True,
+                     column_config={'created_at': _TIMESTAMP_COLUMN})
+
+        # One id -> record dict built per rerun; the selectbox
+        # format_func and the detail lookup below are then O(1)
+        # instead of a linear scan per rendered option
+        _scenario_by_id = {s['id']: s for s in scenarios}
+
+        # Select scenario to view details or load
+        selected_id = st.selectbox("Select scenario to view or load:",
+                                  options=list(_scenario_by_id),
+                                  format_func=lambda x: _scenario_by_id[x]['name'] if x in _scenario_by_id else str(x))
+
         if selected_id:
-            selected_scenario = next((s for s in scenarios if s['id'] == selected_id), None)
-            
+            selected_scenario = _scenario_by_id.get(selected_id)
+
             if selected_scenario:
                 # Display scenario details
                 st.subheader(f"Scenario: {selected_scenario['name']}")
-                
+
                 if selected_scenario['description']:
                     st.markdown(selected_scenario['description'])
-                
+
                 col1, col2, col3 = st.columns(3)
-                
+
                 with col1:
                     st.metric("Initial Salinity", f"{selected_scenario['initial_salinity']} PSU")
-                    
+
                 with col2:
                     st.metric("Target Salinity", f"{selected_scenario['target_salinity']} PSU")
-                    
+
                 with col3:
                     st.metric("Surface Area", f"{selected_scenario['area_km2']:,.0f} km²")
-                
+
                 # Actions for the selected scenario
                 col1, col2, col3 = st.columns(3)
-                
+
                 with col1:
                     if st.button("Load Parameters", key="load_params"):
                         # Store in session state to use in other pages
@@ -82,34 +130,42 @@ with tab1:
                         st.session_state['depth_m'] = selected_scenario['depth_m']
                         st.session_state['season'] = selected_scenario['season']
                         st.session_state['grid_size'] = selected_scenario['grid_size']
-                        
+
                         st.success("Parameters loaded! Navigate to other pages to use them.")
-                
+
                 with col2:
                     if st.button("Delete", key="delete_scenario"):
                         if delete_scenario(selected_id):
-                            st.experimental_rerun()
-                
+                            _invalidate_caches()
+                            st.rerun()
+
                 with col3:
-                    favorite = selected_scenario['is_favorite']
-                    new_favorite = st.checkbox("Favorite", value=favorite)
-                    
-                    if new_favorite != favorite:
-                        update_scenario(selected_id, is_favorite=new_favorite)
-                        st.experimental_rerun()
-                
-                # Show simulation results for this scenario
-                results = get_results(scenario_id=selected_id)
-                
+                    def _toggle_favorite():
+                        update_scenario(selected_id, is_favorite=st.session_state['favorite_toggle'])
+                        # Only the scenarios listing changed; the results
+                        # caches stay warm, and the rerun the checkbox
+                        # interaction already triggers picks up the new
+                        # value — no explicit rerun call needed
+                        _cached_scenarios.clear()
+
+                    st.checkbox("Favorite", value=selected_scenario['is_favorite'],
+                                key="favorite_toggle", on_change=_toggle_favorite)
+
+                # Show simulation results for this scenario; project to
+                # the displayed columns so the JSON blobs stay server-side
+                results = _cached_results(scenario_id=selected_id,
+                                          columns=tuple(_RESULT_COLS))
+
                 if results:
                     st.subheader("Previous Simulation Results")
-                    
-                    results_df = pd.DataFrame(results)
-                    results_df['run_at'] = pd.to_datetime(results_df['run_at']).dt.strftime('%Y-%m-%d %H:%M')
-                    
+
+                    results_df = pd.DataFrame.from_records(
+                        results, columns=list(_RESULT_COLS)).astype(_RESULT_COLS)
+
                     # Display core metrics
                     display_cols = ['run_at', 'freshwater_volume_km3', 'newly_frozen_area', 'total_frozen_area']
-                    st.dataframe(results_df[display_cols], use_container_width=True)
+                    st.dataframe(results_df[display_cols], use_container_width=True,
+                                 column_config={'run_at': _TIMESTAMP_COLUMN})
 
 # Tab 2: Save current scenario
 with tab2:
@@ -161,8 +217,7 @@ with tab2:
         submit_button = st.form_submit_button("Save Scenario")
         
         if submit_button:
-            # Save to database
-            scenario_id = save_scenario(
+            scenario_kwargs = dict(
                 name=name,
                 description=description,
                 initial_salinity=initial_salinity,
@@ -173,14 +228,13 @@ with tab2:
                 grid_size=grid_size,
                 is_favorite=is_favorite
             )
-            
-            if scenario_id:
-                st.success(f"Scenario '{name}' saved successfully!")
-                
-                # Also save the current results if we have them
-                if 'freshwater_volume_km3' in st.session_state:
-                    save_result(
-                        scenario_id=scenario_id,
+
+            # When the session has current results, write the scenario and
+            # the result row in one transaction instead of two round trips
+            if 'freshwater_volume_km3' in st.session_state:
+                scenario_id, _ = save_scenario_with_result(
+                    scenario_kwargs=scenario_kwargs,
+                    result_kwargs=dict(
                         freshwater_volume_km3=st.session_state.get('freshwater_volume_km3'),
                         currently_frozen_area=st.session_state.get('currently_frozen_area'),
                         newly_frozen_area=st.session_state.get('newly_frozen_area'),
@@ -189,6 +243,13 @@ with tab2:
                         plants_needed=st.session_state.get('plants_needed'),
                         energy_twh_total=st.session_state.get('energy_twh_total')
                     )
+                )
+            else:
+                scenario_id = save_scenario(**scenario_kwargs)
+
+            if scenario_id:
+                st.success(f"Scenario '{name}' saved successfully!")
+                _invalidate_caches()
             else:
                 st.error("Failed to save scenario.")
 
@@ -196,30 +257,34 @@ with tab2:
 with tab3:
     st.subheader("Simulation History")
     
-    # Get recent simulation results
-    results = get_results(limit=20)
+    # Get recent simulation results: every scalar column the listing
+    # and detail view need, but not the detailed_results JSON blobs —
+    # those are fetched lazily for the one selected row
+    results = _cached_results(limit=20,
+                              columns=tuple(_RESULT_COLS) + ('plants_needed', 'energy_twh_total'))
     
     if not results:
         st.info("No simulation history found. Run some simulations first.")
     else:
         # Convert to DataFrame for display
-        df = pd.DataFrame(results)
-        df['run_at'] = pd.to_datetime(df['run_at']).dt.strftime('%Y-%m-%d %H:%M')
-        
+        df = pd.DataFrame.from_records(
+            results, columns=list(_RESULT_COLS)).astype(_RESULT_COLS)
+
         # Display results
-        st.dataframe(df[[
-            'id', 'scenario_id', 'run_at', 'freshwater_volume_km3', 
-            'newly_frozen_area', 'total_frozen_area', 'percent_global_desal'
-        ]], use_container_width=True)
+        st.dataframe(df, use_container_width=True,
+                     column_config={'run_at': _TIMESTAMP_COLUMN})
         
         # Select result to view details
         if len(results) > 0:
-            selected_result_id = st.selectbox("Select result to view details:", 
-                                           options=[r['id'] for r in results],
-                                           format_func=lambda x: f"Result {x} - {next((r['run_at'] for r in results if r['id'] == x), '')}")
-            
+            # Same O(1) lookup structure as the scenarios tab
+            _result_by_id = {r['id']: r for r in results}
+
+            selected_result_id = st.selectbox("Select result to view details:",
+                                           options=list(_result_by_id),
+                                           format_func=lambda x: f"Result {x} - {_result_by_id[x]['run_at'] if x in _result_by_id else ''}")
+
             if selected_result_id:
-                selected_result = next((r for r in results if r['id'] == selected_result_id), None)
+                selected_result = _result_by_id.get(selected_result_id)
                 
                 if selected_result:
                     # Display details
@@ -253,19 +318,16 @@ with tab3:
                         with col3:
                             st.metric("Energy (TWh)", f"{selected_result['energy_twh_total']:.0f}")
                     
-                    # Show detailed results if available
-                    if selected_result['detailed_results'] and isinstance(selected_result['detailed_results'], dict):
-                        detailed = selected_result['detailed_results']
-                        
+                    # Show detailed results if available, fetching only
+                    # the selected row's JSON blob
+                    detailed = _cached_result_details(selected_result_id)
+                    if detailed and isinstance(detailed, dict):
                         if 'river_comparisons' in detailed and isinstance(detailed['river_comparisons'], dict):
                             st.subheader("River Comparisons")
-                            
-                            river_df = pd.DataFrame({
-                                'Water Source': list(detailed['river_comparisons'].keys()),
-                                'Percentage': list(detailed['river_comparisons'].values())
-                            })
-                            
-                            st.bar_chart(river_df.set_index('Water Source'))
+
+                            # st.bar_chart accepts the dict directly; no
+                            # intermediate Series/DataFrame needed
+                            st.bar_chart(detailed['river_comparisons'])
 
 # Add a divider
 st.markdown("---")
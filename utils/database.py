@@ -6,27 +6,82 @@ scenarios, results, and user favorites.
 """
 import os
 import json
-import datetime
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, Text, Boolean
+from contextlib import contextmanager
+from functools import lru_cache
+from sqlalchemy import create_engine, delete, func, insert, select, text, update, Column, Index, Integer, Float, String, DateTime, Text, Boolean, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-
-# Get database connection string from environment variable
-DATABASE_URL = os.environ.get('DATABASE_URL')
-
-# Create SQLAlchemy engine with connection pooling and retry settings
-engine = create_engine(
-    DATABASE_URL,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,  # Recycle connections after 30 minutes
-    pool_pre_ping=True,  # Verify connections before using them
-    connect_args={"connect_timeout": 10}  # Connection timeout in seconds
-)
-Session = sessionmaker(bind=engine)
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """
+    Create the process-wide SQLAlchemy engine on first use.
+
+    Built lazily so merely importing this module never reads
+    DATABASE_URL or touches the network; pages that only use the
+    calculation or plotting helpers import cleanly without a database.
+    """
+    # Get database connection string from environment variable
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        raise RuntimeError(
+            "DATABASE_URL environment variable is not set; "
+            "it is required for database operations"
+        )
+
+    # Engine with connection pooling and retry settings
+    return create_engine(
+        database_url,
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_recycle=1800,  # Recycle connections after 30 minutes
+        pool_pre_ping=True,  # Verify connections before using them
+        insertmanyvalues_page_size=10000,  # Batch multi-row inserts
+        query_cache_size=1200,  # Room for every helper's compiled statements
+        connect_args={"connect_timeout": 10}  # Connection timeout in seconds
+    )
+
+@lru_cache(maxsize=1)
+def _session_registry():
+    # Thread-local session registry: each helper call reuses the session
+    # (and its pooled connection and compiled-statement cache) bound to
+    # its thread instead of building and tearing one down per call.
+    # expire_on_commit=False keeps attributes like freshly assigned ids
+    # readable after the commit without a refetch.
+    return scoped_session(sessionmaker(bind=get_engine(), expire_on_commit=False))
+
 Base = declarative_base()
 
+# JSONB on PostgreSQL so the driver hands back native dicts/lists (no
+# per-row json.loads in Python) and values are indexable server-side;
+# generic JSON elsewhere (e.g. SQLite in local testing)
+_JSON = JSON().with_variant(JSONB(), 'postgresql')
+
+@contextmanager
+def session_scope():
+    """
+    Provide a transactional scope around a series of operations.
+
+    Commits on success and rolls back on error; the underlying
+    connection goes back to the pool rather than being torn down.
+
+    Also ensures the schema exists first: in the multipage model only
+    the visited page's script runs, so a deep link into any DB-using
+    page must not depend on app.py having called init_db. The done-flag
+    makes this a plain attribute check after the first call.
+    """
+    init_db()
+    session = _session_registry()()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
 class SimulationScenario(Base):
     """
     Stores simulation scenarios with parameters for salinity reduction simulations.
@@ -36,8 +91,13 @@ class SimulationScenario(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    modified_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    # Timestamps come from the database clock: default=func.now()
+    # renders now() inline in the INSERT (so tables created before the
+    # DDL default existed still get values), server_default covers rows
+    # written outside SQLAlchemy, and onupdate folds the touch into the
+    # UPDATE itself
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    modified_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
     
     # Simulation parameters
     initial_salinity = Column(Float, nullable=False)
@@ -50,6 +110,13 @@ class SimulationScenario(Base):
     grid_size = Column(Integer, default=100)
     is_favorite = Column(Boolean, default=False)
 
+    __table_args__ = (
+        # Partial index serving the favorites filter without touching
+        # the (typically much larger) non-favorite rows
+        Index('ix_scenarios_favorite', 'is_favorite',
+              postgresql_where=text('is_favorite')),
+    )
+
 class SimulationResult(Base):
     """
     Stores results from simulations for historical tracking and comparison.
@@ -58,7 +125,7 @@ class SimulationResult(Base):
     
     id = Column(Integer, primary_key=True)
     scenario_id = Column(Integer, nullable=False)
-    run_at = Column(DateTime, default=datetime.datetime.utcnow)
+    run_at = Column(DateTime, default=func.now(), server_default=func.now())
     
     # Core results
     freshwater_volume_km3 = Column(Float, nullable=False)
@@ -71,17 +138,25 @@ class SimulationResult(Base):
     plants_needed = Column(Integer, nullable=True)
     energy_twh_total = Column(Float, nullable=True)
     
-    # Serialized detailed results (JSON)
-    detailed_results = Column(Text, nullable=True)
+    # Detailed results (JSONB on PostgreSQL)
+    detailed_results = Column(_JSON, nullable=True)
+
+    __table_args__ = (
+        # Matches get_results' filter-by-scenario + newest-first LIMIT
+        # pattern, so the planner can walk the index and stop at the
+        # limit instead of seq-scanning and sorting
+        Index('ix_results_scenario_run', 'scenario_id', text('run_at DESC')),
+    )
 
 class GeoEngineeringApproach(Base):
     """
     Stores information about different geoengineering approaches for comparison.
     """
     __tablename__ = 'geoengineering_approaches'
-    
+
     id = Column(Integer, primary_key=True)
-    name = Column(String(100), nullable=False)
+    # Unique so the seed insert can key ON CONFLICT on it
+    name = Column(String(100), nullable=False, unique=True)
     description = Column(Text, nullable=True)
     
     # Metrics (1-10 scale)
@@ -92,104 +167,143 @@ class GeoEngineeringApproach(Base):
     technological_readiness = Column(Integer, nullable=False)
     scalability = Column(Integer, nullable=False)
     
-    # Additional details
-    methods = Column(Text, nullable=True)  # JSON list
-    advantages = Column(Text, nullable=True)  # JSON list
-    challenges = Column(Text, nullable=True)  # JSON list
+    # Additional details (JSON lists)
+    methods = Column(_JSON, nullable=True)
+    advantages = Column(_JSON, nullable=True)
+    challenges = Column(_JSON, nullable=True)
+
+# Default geoengineering approach seed rows as plain dicts, kept
+# Core-friendly so init_db can bulk-insert them in a single
+# multi-values statement.
+_DEFAULT_APPROACH_ROWS = [
+    dict(
+        name="Salinity Reduction",
+        description="Reducing the salinity of surface water to increase its freezing point and promote ice formation.",
+        effectiveness=7,
+        feasibility=5,
+        cost_efficiency=4,
+        environmental_impact=6,
+        technological_readiness=4,
+        scalability=6,
+        methods=["Freshwater addition", "Desalination ships", "River diversion"],
+        advantages=["Works with natural freezing processes", "Potentially reversible", "Could be targeted regionally"],
+        challenges=["Requires large volumes of freshwater", "Logistical complexity", "Ocean mixing challenges"],
+    ),
+    dict(
+        name="Ice Thickening",
+        description="Pumping water onto the surface of ice sheets to freeze and thicken the ice.",
+        effectiveness=6,
+        feasibility=7,
+        cost_efficiency=6,
+        environmental_impact=7,
+        technological_readiness=7,
+        scalability=4,
+        methods=["Surface pumping systems", "Renewable energy-powered pumps"],
+        advantages=["Directly adds ice mass", "Proven in small-scale tests", "Relatively straightforward technology"],
+        challenges=["Energy requirements", "Limited to existing ice areas", "Coverage limitations"],
+    ),
+    dict(
+        name="Reflective Materials",
+        description="Spreading reflective materials on ice surfaces to increase albedo and reduce melting.",
+        effectiveness=8,
+        feasibility=6,
+        cost_efficiency=5,
+        environmental_impact=4,
+        technological_readiness=6,
+        scalability=7,
+        methods=["Glass microbeads", "Reflective films", "Engineered particles"],
+        advantages=["Could reduce melting by up to 30%", "Immediate effect", "Adaptable to different regions"],
+        challenges=["Environmental concerns", "Material dispersion", "Potential ecological impacts"],
+    ),
+    dict(
+        name="Undersea Barriers",
+        description="Constructing underwater curtains or barriers to block warm ocean currents from reaching ice shelves.",
+        effectiveness=7,
+        feasibility=3,
+        cost_efficiency=2,
+        environmental_impact=5,
+        technological_readiness=3,
+        scalability=5,
+        methods=["Floating curtains", "Seabed anchored barriers", "Thermal screens"],
+        advantages=["Targets a major cause of ice shelf melting", "Could protect critical glaciers", "Long-lasting"],
+        challenges=["Enormous engineering challenge", "Very high costs", "Potential navigation impacts"],
+    ),
+    dict(
+        name="Cloud Seeding",
+        description="Enhancing snowfall over ice sheets by seeding clouds with substances like silver iodide.",
+        effectiveness=5,
+        feasibility=6,
+        cost_efficiency=7,
+        environmental_impact=5,
+        technological_readiness=8,
+        scalability=6,
+        methods=["Aircraft dispersal", "Ground-based generators", "Drone systems"],
+        advantages=["Builds on existing technology", "Could increase ice accumulation", "Relatively low cost"],
+        challenges=["Weather dependency", "Uncertain efficacy", "Limited geographical application"],
+    ),
+    dict(
+        name="Geotextiles",
+        description="Wrapping glaciers in protective films or geotextiles to insulate them and reduce heat absorption.",
+        effectiveness=4,
+        feasibility=5,
+        cost_efficiency=3,
+        environmental_impact=6,
+        technological_readiness=7,
+        scalability=3,
+        methods=["Insulating blankets", "Reflective covers", "Biodegradable films"],
+        advantages=["Demonstrated effectiveness in small areas", "Targeted protection", "Removable"],
+        challenges=["Scaling limitations", "Material requirements", "Visual impact"],
+    ),
+]
 
 # Database initialization function
 def init_db():
     """
     Initialize the database by creating all tables if they don't exist.
+
+    Idempotent and cheap to call repeatedly: after the first successful
+    run in a process it returns immediately, so callers can invoke it at
+    startup without paying the per-table existence checks on every rerun.
     """
-    Base.metadata.create_all(engine)
-    
-    # Add default geoengineering approaches if the table is empty
-    session = Session()
-    if session.query(GeoEngineeringApproach).count() == 0:
-        default_approaches = [
-            GeoEngineeringApproach(
-                name="Salinity Reduction",
-                description="Reducing the salinity of surface water to increase its freezing point and promote ice formation.",
-                effectiveness=7,
-                feasibility=5,
-                cost_efficiency=4,
-                environmental_impact=6,
-                technological_readiness=4,
-                scalability=6,
-                methods=json.dumps(["Freshwater addition", "Desalination ships", "River diversion"]),
-                advantages=json.dumps(["Works with natural freezing processes", "Potentially reversible", "Could be targeted regionally"]),
-                challenges=json.dumps(["Requires large volumes of freshwater", "Logistical complexity", "Ocean mixing challenges"]),
-            ),
-            GeoEngineeringApproach(
-                name="Ice Thickening",
-                description="Pumping water onto the surface of ice sheets to freeze and thicken the ice.",
-                effectiveness=6,
-                feasibility=7,
-                cost_efficiency=6,
-                environmental_impact=7,
-                technological_readiness=7,
-                scalability=4,
-                methods=json.dumps(["Surface pumping systems", "Renewable energy-powered pumps"]),
-                advantages=json.dumps(["Directly adds ice mass", "Proven in small-scale tests", "Relatively straightforward technology"]),
-                challenges=json.dumps(["Energy requirements", "Limited to existing ice areas", "Coverage limitations"]),
-            ),
-            GeoEngineeringApproach(
-                name="Reflective Materials",
-                description="Spreading reflective materials on ice surfaces to increase albedo and reduce melting.",
-                effectiveness=8,
-                feasibility=6,
-                cost_efficiency=5,
-                environmental_impact=4,
-                technological_readiness=6,
-                scalability=7,
-                methods=json.dumps(["Glass microbeads", "Reflective films", "Engineered particles"]),
-                advantages=json.dumps(["Could reduce melting by up to 30%", "Immediate effect", "Adaptable to different regions"]),
-                challenges=json.dumps(["Environmental concerns", "Material dispersion", "Potential ecological impacts"]),
-            ),
-            GeoEngineeringApproach(
-                name="Undersea Barriers",
-                description="Constructing underwater curtains or barriers to block warm ocean currents from reaching ice shelves.",
-                effectiveness=7,
-                feasibility=3,
-                cost_efficiency=2,
-                environmental_impact=5,
-                technological_readiness=3,
-                scalability=5,
-                methods=json.dumps(["Floating curtains", "Seabed anchored barriers", "Thermal screens"]),
-                advantages=json.dumps(["Targets a major cause of ice shelf melting", "Could protect critical glaciers", "Long-lasting"]),
-                challenges=json.dumps(["Enormous engineering challenge", "Very high costs", "Potential navigation impacts"]),
-            ),
-            GeoEngineeringApproach(
-                name="Cloud Seeding",
-                description="Enhancing snowfall over ice sheets by seeding clouds with substances like silver iodide.",
-                effectiveness=5,
-                feasibility=6,
-                cost_efficiency=7,
-                environmental_impact=5,
-                technological_readiness=8,
-                scalability=6,
-                methods=json.dumps(["Aircraft dispersal", "Ground-based generators", "Drone systems"]),
-                advantages=json.dumps(["Builds on existing technology", "Could increase ice accumulation", "Relatively low cost"]),
-                challenges=json.dumps(["Weather dependency", "Uncertain efficacy", "Limited geographical application"]),
-            ),
-            GeoEngineeringApproach(
-                name="Geotextiles",
-                description="Wrapping glaciers in protective films or geotextiles to insulate them and reduce heat absorption.",
-                effectiveness=4,
-                feasibility=5,
-                cost_efficiency=3,
-                environmental_impact=6,
-                technological_readiness=7,
-                scalability=3,
-                methods=json.dumps(["Insulating blankets", "Reflective covers", "Biodegradable films"]),
-                advantages=json.dumps(["Demonstrated effectiveness in small areas", "Targeted protection", "Removable"]),
-                challenges=json.dumps(["Scaling limitations", "Material requirements", "Visual impact"]),
-            ),
-        ]
-        session.add_all(default_approaches)
-        session.commit()
-    session.close()
+    if getattr(init_db, "_done", False):
+        return
+
+    # One connection and one transaction for DDL plus seed: the tables
+    # and default rows commit together (Postgres DDL is transactional),
+    # so first-run setup pays a single commit instead of a create_all
+    # round trip followed by a separate seed transaction.
+    with get_engine().begin() as conn:
+        Base.metadata.create_all(conn)
+
+        # Seed the default geoengineering approaches. The LIMIT 1 probe
+        # keeps startup working on databases created before name was
+        # unique — create_all(checkfirst) won't add the constraint to an
+        # existing table, and ON CONFLICT errors without it. On fresh
+        # schemas the insert itself is race-free across concurrent
+        # worker starts.
+        if conn.execute(select(GeoEngineeringApproach.id).limit(1)).first() is None:
+            conn.execute(
+                pg_insert(GeoEngineeringApproach)
+                .values(_DEFAULT_APPROACH_ROWS)
+                .on_conflict_do_nothing(index_elements=['name'])
+            )
+
+    init_db._done = True
+
+# Column lists for the read helpers: selecting columns instead of ORM
+# entities skips instance construction and identity-map bookkeeping and
+# lets rows convert straight to dicts via Row._mapping.
+_SCENARIO_COLUMNS = (
+    'id', 'name', 'description', 'initial_salinity', 'target_salinity',
+    'area_km2', 'depth_m', 'season', 'grid_size', 'is_favorite',
+    'created_at', 'modified_at'
+)
+_RESULT_COLUMNS = (
+    'id', 'scenario_id', 'run_at', 'freshwater_volume_km3',
+    'currently_frozen_area', 'newly_frozen_area', 'total_frozen_area',
+    'percent_global_desal', 'plants_needed', 'energy_twh_total',
+    'detailed_results'
+)
 
 # Scenario operations
 def save_scenario(name, description, initial_salinity, target_salinity, area_km2, depth_m, season, grid_size=100, is_favorite=False):
@@ -199,23 +313,21 @@ def save_scenario(name, description, initial_salinity, target_salinity, area_km2
     Returns:
         The ID of the saved scenario.
     """
-    session = Session()
-    scenario = SimulationScenario(
-        name=name,
-        description=description,
-        initial_salinity=initial_salinity,
-        target_salinity=target_salinity,
-        area_km2=area_km2,
-        depth_m=depth_m,
-        season=season,
-        grid_size=grid_size,
-        is_favorite=is_favorite
-    )
-    session.add(scenario)
-    session.commit()
-    scenario_id = scenario.id
-    session.close()
-    return scenario_id
+    with session_scope() as session:
+        scenario = SimulationScenario(
+            name=name,
+            description=description,
+            initial_salinity=initial_salinity,
+            target_salinity=target_salinity,
+            area_km2=area_km2,
+            depth_m=depth_m,
+            season=season,
+            grid_size=grid_size,
+            is_favorite=is_favorite
+        )
+        session.add(scenario)
+        session.flush()  # Assigns scenario.id
+        return scenario.id
 
 def get_scenarios(favorite_only=False):
     """
@@ -228,29 +340,13 @@ def get_scenarios(favorite_only=False):
         List of scenario dictionaries.
     """
     try:
-        session = Session()
-        query = session.query(SimulationScenario)
-        if favorite_only:
-            query = query.filter(SimulationScenario.is_favorite == True)
-        scenarios = [
-            {
-                'id': s.id,
-                'name': s.name,
-                'description': s.description,
-                'initial_salinity': s.initial_salinity,
-                'target_salinity': s.target_salinity,
-                'area_km2': s.area_km2,
-                'depth_m': s.depth_m,
-                'season': s.season,
-                'grid_size': s.grid_size,
-                'is_favorite': s.is_favorite,
-                'created_at': s.created_at,
-                'modified_at': s.modified_at
-            }
-            for s in query.all()
-        ]
-        session.close()
-        return scenarios
+        with session_scope() as session:
+            stmt = select(*(getattr(SimulationScenario, name) for name in _SCENARIO_COLUMNS))
+            if favorite_only:
+                stmt = stmt.where(SimulationScenario.is_favorite == True)
+            # mappings() yields dict-like views straight off the DBAPI
+            # rows; dict() materializes them for callers that mutate
+            return [dict(m) for m in session.execute(stmt).mappings()]
     except Exception as e:
         print(f"Database error in get_scenarios: {e}")
         # Return an empty list as fallback
@@ -263,28 +359,11 @@ def get_scenario(scenario_id):
     Returns:
         Scenario dictionary or None if not found.
     """
-    session = Session()
-    scenario = session.query(SimulationScenario).filter(SimulationScenario.id == scenario_id).first()
-    if not scenario:
-        session.close()
-        return None
-    
-    result = {
-        'id': scenario.id,
-        'name': scenario.name,
-        'description': scenario.description,
-        'initial_salinity': scenario.initial_salinity,
-        'target_salinity': scenario.target_salinity,
-        'area_km2': scenario.area_km2,
-        'depth_m': scenario.depth_m,
-        'season': scenario.season,
-        'grid_size': scenario.grid_size,
-        'is_favorite': scenario.is_favorite,
-        'created_at': scenario.created_at,
-        'modified_at': scenario.modified_at
-    }
-    session.close()
-    return result
+    with session_scope() as session:
+        stmt = select(*(getattr(SimulationScenario, name) for name in _SCENARIO_COLUMNS)).where(
+            SimulationScenario.id == scenario_id)
+        row = session.execute(stmt).mappings().first()
+        return dict(row) if row else None
 
 def update_scenario(scenario_id, **kwargs):
     """
@@ -297,20 +376,15 @@ def update_scenario(scenario_id, **kwargs):
     Returns:
         True if successful, False if scenario not found
     """
-    session = Session()
-    scenario = session.query(SimulationScenario).filter(SimulationScenario.id == scenario_id).first()
-    if not scenario:
-        session.close()
-        return False
-    
-    for key, value in kwargs.items():
-        if hasattr(scenario, key):
-            setattr(scenario, key, value)
-    
-    scenario.modified_at = datetime.datetime.utcnow()
-    session.commit()
-    session.close()
-    return True
+    with session_scope() as session:
+        # One UPDATE statement instead of a SELECT round trip followed
+        # by a unit-of-work flush; rowcount tells us whether the row
+        # existed. modified_at comes from the column's onupdate.
+        values = {key: value for key, value in kwargs.items()
+                  if key in SimulationScenario.__table__.columns}
+        result = session.execute(update(SimulationScenario).where(
+            SimulationScenario.id == scenario_id).values(**values))
+        return result.rowcount > 0
 
 def delete_scenario(scenario_id):
     """
@@ -319,16 +393,37 @@ def delete_scenario(scenario_id):
     Returns:
         True if deleted, False if not found
     """
-    session = Session()
-    scenario = session.query(SimulationScenario).filter(SimulationScenario.id == scenario_id).first()
-    if not scenario:
-        session.close()
-        return False
-    
-    session.delete(scenario)
-    session.commit()
-    session.close()
-    return True
+    with session_scope() as session:
+        # Single DELETE round trip; no need to load the row first
+        result = session.execute(delete(SimulationScenario).where(
+            SimulationScenario.id == scenario_id))
+        return result.rowcount > 0
+
+def save_scenario_with_result(scenario_kwargs, result_kwargs):
+    """
+    Save a scenario and its simulation result in a single transaction.
+
+    The scenario id is obtained with a flush rather than an intermediate
+    commit, so the two inserts reach the database as one transaction
+    instead of two separate write round trips.
+
+    Args:
+        scenario_kwargs: Fields for the SimulationScenario row
+        result_kwargs: Fields for the SimulationResult row (without scenario_id);
+            detailed_results may be passed as a plain dict (JSON column).
+
+    Returns:
+        Tuple of (scenario_id, result_id).
+    """
+    with session_scope() as session:
+        scenario = SimulationScenario(**scenario_kwargs)
+        session.add(scenario)
+        session.flush()  # Assigns scenario.id inside the open transaction
+
+        result = SimulationResult(scenario_id=scenario.id, **result_kwargs)
+        session.add(result)
+        session.flush()  # Assigns result.id
+        return scenario.id, result.id
 
 # Result operations
 def save_result(scenario_id, freshwater_volume_km3, currently_frozen_area=None, newly_frozen_area=None, 
@@ -346,79 +441,162 @@ def save_result(scenario_id, freshwater_volume_km3, currently_frozen_area=None,
         percent_global_desal: Percentage of global desalination capacity
         plants_needed: Number of desalination plants needed
         energy_twh_total: Total energy required in TWh
-        detailed_results: JSON string with detailed results
-        
+        detailed_results: Dict with detailed results (stored as JSON)
+
     Returns:
         The ID of the saved result
     """
-    session = Session()
-    result = SimulationResult(
-        scenario_id=scenario_id,
-        freshwater_volume_km3=freshwater_volume_km3,
-        currently_frozen_area=currently_frozen_area,
-        newly_frozen_area=newly_frozen_area,
-        total_frozen_area=total_frozen_area,
-        percent_global_desal=percent_global_desal,
-        plants_needed=plants_needed,
-        energy_twh_total=energy_twh_total,
-        detailed_results=json.dumps(detailed_results) if detailed_results else None
-    )
-    session.add(result)
-    session.commit()
-    result_id = result.id
-    session.close()
-    return result_id
+    with session_scope() as session:
+        result = SimulationResult(
+            scenario_id=scenario_id,
+            freshwater_volume_km3=freshwater_volume_km3,
+            currently_frozen_area=currently_frozen_area,
+            newly_frozen_area=newly_frozen_area,
+            total_frozen_area=total_frozen_area,
+            percent_global_desal=percent_global_desal,
+            plants_needed=plants_needed,
+            energy_twh_total=energy_twh_total,
+            detailed_results=detailed_results
+        )
+        session.add(result)
+        session.flush()  # Assigns result.id
+        return result.id
+
+def save_results_bulk(rows):
+    """
+    Save many simulation results in a single transaction.
+
+    Intended for parameter sweeps: instead of one Session/commit cycle
+    per row via save_result, all rows ship in one multi-values Core
+    INSERT ... RETURNING, collecting the new ids in the same round trip.
 
-def get_results(scenario_id=None, limit=10):
+    Args:
+        rows: List of dicts of SimulationResult fields. scenario_id and
+            freshwater_volume_km3 are required; detailed_results may be
+            a plain dict (JSON column).
+
+    Returns:
+        List of saved result IDs, in the same order as rows.
+    """
+    if not rows:
+        return []
+    with session_scope() as session:
+        result = session.execute(
+            insert(SimulationResult).returning(
+                SimulationResult.id, sort_by_parameter_order=True),
+            rows
+        )
+        return [row[0] for row in result]
+
+def get_results(scenario_id=None, limit=10, columns=None):
     """
     Get simulation results from the database.
-    
+
     Args:
         scenario_id: Optional ID to filter results by scenario
         limit: Maximum number of results to return
-        
+        columns: Optional list of column names restricting the SELECT
+            list, so large fields (notably the detailed_results JSON
+            blob) are not pulled over the wire when the caller doesn't
+            need them
+
     Returns:
         List of result dictionaries
     """
     try:
-        session = Session()
-        query = session.query(SimulationResult)
-        if scenario_id:
-            query = query.filter(SimulationResult.scenario_id == scenario_id)
-        
-        query = query.order_by(SimulationResult.run_at.desc()).limit(limit)
-        
-        results = [
-            {
-                'id': r.id,
-                'scenario_id': r.scenario_id,
-                'run_at': r.run_at,
-                'freshwater_volume_km3': r.freshwater_volume_km3,
-                'currently_frozen_area': r.currently_frozen_area,
-                'newly_frozen_area': r.newly_frozen_area,
-                'total_frozen_area': r.total_frozen_area,
-                'percent_global_desal': r.percent_global_desal,
-                'plants_needed': r.plants_needed,
-                'energy_twh_total': r.energy_twh_total,
-                'detailed_results': json.loads(r.detailed_results) if r.detailed_results else None
-            }
-            for r in query.all()
-        ]
-        session.close()
-        return results
+        with session_scope() as session:
+            names = tuple(columns) if columns else _RESULT_COLUMNS
+            stmt = select(*(getattr(SimulationResult, name) for name in names))
+            if scenario_id:
+                stmt = stmt.where(SimulationResult.scenario_id == scenario_id)
+
+            stmt = stmt.order_by(SimulationResult.run_at.desc()).limit(limit)
+
+            # detailed_results, when selected, comes back already decoded
+            # by the driver (JSONB) or the column type
+            return [dict(m) for m in session.execute(stmt).mappings()]
     except Exception as e:
         print(f"Database error in get_results: {e}")
         # Return an empty list as fallback
         return []
 
+def load_detailed(result):
+    """
+    Return the detailed_results of a result dict, decoding on first
+    access if it is still a raw JSON string (rows written before the
+    column moved to JSONB). Decoded values replace the string in place,
+    so repeated calls decode at most once.
+
+    Args:
+        result: A result dict as returned by get_results
+
+    Returns:
+        Decoded detailed-results dict, or None if absent
+    """
+    detailed = result.get('detailed_results')
+    if isinstance(detailed, str):
+        detailed = json.loads(detailed)
+        result['detailed_results'] = detailed
+    return detailed
+
+def get_result_details(result_id):
+    """
+    Get the detailed_results blob for a single simulation result.
+
+    Lets listing callers project detailed_results out of get_results and
+    fetch only the one selected row's JSON when it is actually viewed.
+
+    Args:
+        result_id: ID of the result
+
+    Returns:
+        Decoded detailed-results dict, or None if absent or on error
+    """
+    try:
+        with session_scope() as session:
+            row = session.execute(select(SimulationResult.detailed_results).where(
+                SimulationResult.id == result_id)).first()
+            if row and row[0]:
+                # JSON column: the value arrives already decoded
+                return row[0]
+            return None
+    except Exception as e:
+        print(f"Database error in get_result_details: {e}")
+        return None
+
 # Geoengineering approach operations
+
+# Process-level cache: the approaches table is seeded once and read on
+# every render, so after one successful fetch (including the JSON
+# decoding of the list columns) later calls are a dict return. Fallback
+# results are deliberately not cached, so a transient outage doesn't pin
+# the defaults for the process lifetime.
+_approaches_cache = None
+
+def clear_approaches_cache():
+    """
+    Invalidate the cached geoengineering approaches.
+
+    Call after any write to the approaches table so the next
+    get_geoengineering_approaches() re-reads the database.
+    """
+    global _approaches_cache
+    _approaches_cache = None
+
 def get_geoengineering_approaches():
     """
     Get all geoengineering approaches from the database.
-    
+
+    The first successful read is cached for the process; see
+    clear_approaches_cache for invalidation.
+
     Returns:
         List of approach dictionaries
     """
+    global _approaches_cache
+    if _approaches_cache is not None:
+        return _approaches_cache
+
     # Default approaches in case of database failure
     default_approaches = [
         {
@@ -509,32 +687,32 @@ def get_geoengineering_approaches():
     
     try:
         # Attempt to connect to the database
-        session = Session()
-        # Use a timeout to avoid hanging
-        query = session.query(GeoEngineeringApproach)
-        approaches = [
-            {
-                'id': a.id,
-                'name': a.name,
-                'description': a.description,
-                'effectiveness': a.effectiveness,
-                'feasibility': a.feasibility,
-                'cost_efficiency': a.cost_efficiency,
-                'environmental_impact': a.environmental_impact,
-                'technological_readiness': a.technological_readiness,
-                'scalability': a.scalability,
-                'methods': json.loads(a.methods) if a.methods else [],
-                'advantages': json.loads(a.advantages) if a.advantages else [],
-                'challenges': json.loads(a.challenges) if a.challenges else []
-            }
-            for a in query.all()
-        ]
-        session.close()
-        
-        # If we successfully retrieved approaches from the database, return them
+        with session_scope() as session:
+            rows = session.execute(select(GeoEngineeringApproach)).scalars()
+            approaches = [
+                {
+                    'id': a.id,
+                    'name': a.name,
+                    'description': a.description,
+                    'effectiveness': a.effectiveness,
+                    'feasibility': a.feasibility,
+                    'cost_efficiency': a.cost_efficiency,
+                    'environmental_impact': a.environmental_impact,
+                    'technological_readiness': a.technological_readiness,
+                    'scalability': a.scalability,
+                    'methods': a.methods or [],
+                    'advantages': a.advantages or [],
+                    'challenges': a.challenges or []
+                }
+                for a in rows
+            ]
+
+        # If we successfully retrieved approaches from the database,
+        # cache and return them
         if approaches:
+            _approaches_cache = approaches
             return approaches
-            
+
     except Exception as e:
         # Log the error (in a real application, use proper logging)
         print(f"Database error in get_geoengineering_approaches: {e}")
@@ -542,7 +720,4 @@ def get_geoengineering_approaches():
     # If we reach here, either there was an exception or no approaches were found
     # Return the default hardcoded approaches as a fallback
     print("Using default hardcoded approaches as fallback")
-    return default_approaches
-
-# Initialize database on module import
-init_db()
\ No newline at end of file
+    return default_approaches
\ No newline at end of file
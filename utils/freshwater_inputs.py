@@ -0,0 +1,40 @@
+"""
+Shared input widgets for freshwater/salinity scenario parameters.
+
+Keeping the widget block in one place means pages that need the same
+parameters (salinities, area, depth) render identical controls without
+duplicating the widget code in each page script.
+"""
+import streamlit as st
+
+def freshwater_inputs():
+    """
+    Render the standard freshwater scenario input widgets.
+
+    Returns:
+    --------
+    tuple
+        (initial_salinity, target_salinity, area_km2, depth_m)
+    """
+    col1, col2 = st.columns(2)
+
+    with col1:
+        initial_salinity = st.slider("Initial salinity (PSU)", 30.0, 35.0, 32.0, 0.1)
+        target_salinity = st.slider("Target salinity (PSU)", 28.0, initial_salinity-0.1, 30.0, 0.1)
+
+    with col2:
+        area = st.number_input("Surface area (km²)",
+                              min_value=1000.0,
+                              max_value=14000000.0,
+                              value=100000.0,
+                              step=10000.0,
+                              help="The Arctic Ocean is approximately 14 million km²")
+
+        depth = st.slider("Surface layer depth (m)",
+                         min_value=1.0,
+                         max_value=50.0,
+                         value=10.0,
+                         step=1.0,
+                         help="Depth of the surface layer to be diluted")
+
+    return initial_salinity, target_salinity, area, depth
@@ -1,11 +1,22 @@
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 from utils.calculations import calculate_freezing_point
 
+@lru_cache(maxsize=8)
+def _arctic_mask(grid_size):
+    """
+    Circular Arctic Ocean mask for a given grid size, computed once per
+    size instead of on every map render.
+    """
+    y, x = np.ogrid[-grid_size//2:grid_size//2, -grid_size//2:grid_size//2]
+    return x**2 + y**2 <= (grid_size//2)**2
+
+@st.cache_data(show_spinner=False)
 def plot_freezing_point_curve(min_salinity=0, max_salinity=40):
     """
     Plot the relationship between salinity and freezing point.
@@ -24,9 +35,9 @@ def plot_freezing_point_curve(min_salinity=0, max_salinity=40):
     """
     # Generate salinity values
     salinity_values = np.linspace(min_salinity, max_salinity, 100)
-    
-    # Calculate corresponding freezing points
-    freezing_points = [calculate_freezing_point(s) for s in salinity_values]
+
+    # Calculate corresponding freezing points in one vectorized call
+    freezing_points = calculate_freezing_point(salinity_values)
     
     # Create the plot
     fig = go.Figure()
@@ -40,27 +51,22 @@ def plot_freezing_point_curve(min_salinity=0, max_salinity=40):
         )
     )
     
-    # Add annotations for notable points
-    fig.add_annotation(
-        x=35, y=calculate_freezing_point(35),
-        text="Global Average Ocean (35 PSU)",
-        showarrow=True,
-        arrowhead=1
-    )
-    
-    fig.add_annotation(
-        x=32, y=calculate_freezing_point(32),
-        text="Typical Arctic Ocean (30-34 PSU)",
-        showarrow=True,
-        arrowhead=1
-    )
-    
-    fig.add_annotation(
-        x=0, y=calculate_freezing_point(0),
-        text="Freshwater (0 PSU)",
-        showarrow=True,
-        arrowhead=1
+    # Add annotations for notable points, with the y-values computed in
+    # one vectorized call
+    annotation_salinities = np.array([35.0, 32.0, 0.0])
+    annotation_y = calculate_freezing_point(annotation_salinities)
+    annotation_texts = (
+        "Global Average Ocean (35 PSU)",
+        "Typical Arctic Ocean (30-34 PSU)",
+        "Freshwater (0 PSU)"
     )
+    for x, y, text in zip(annotation_salinities, annotation_y, annotation_texts):
+        fig.add_annotation(
+            x=x, y=y,
+            text=text,
+            showarrow=True,
+            arrowhead=1
+        )
     
     # Set axis labels and title
     fig.update_layout(
@@ -72,15 +78,18 @@ def plot_freezing_point_curve(min_salinity=0, max_salinity=40):
     
     return fig
 
-def plot_freshwater_requirements(results):
+@st.cache_data(show_spinner=False)
+def plot_freshwater_requirements(freshwater_volume_km3):
     """
     Create a bar chart showing the freshwater requirements compared to various references.
-    
+
     Parameters:
     -----------
-    results : dict
-        Dictionary containing calculation results
-        
+    freshwater_volume_km3 : float
+        Required freshwater volume in km³. Taking the scalar directly
+        keeps the cache key a single float instead of a deep-hashed
+        results dict.
+
     Returns:
     --------
     plotly.graph_objects.Figure
@@ -88,30 +97,30 @@ def plot_freshwater_requirements(results):
     """
     # Extract river comparison data
     river_data = {
-        'Freshwater Required': results['freshwater_volume_km3'],
+        'Freshwater Required': freshwater_volume_km3,
         'Annual Amazon River Flow': 5500,
         'Annual Mississippi River Flow': 580,
         'Annual Rhine River Flow': 70,
         'Global Annual Desalination Capacity': 36.5
     }
     
-    # Create the plot
-    fig = go.Figure()
-    
-    for name, value in river_data.items():
-        fig.add_trace(
-            go.Bar(
-                x=[name],
-                y=[value],
-                name=name
-            )
+    # One Bar trace carrying every category: a single trace object in
+    # the figure JSON and one draw pass in the browser, instead of five
+    names = list(river_data)
+    fig = go.Figure(
+        go.Bar(
+            x=names,
+            y=[river_data[name] for name in names],
+            marker_color=px.colors.qualitative.Plotly[:len(names)]
         )
-    
+    )
+
     # Set axis labels and title
     fig.update_layout(
         title="Freshwater Volume Required Compared to Natural Sources (km³)",
         yaxis_title="Volume (km³)",
-        height=500
+        height=500,
+        showlegend=False
     )
     
     return fig
@@ -134,28 +143,37 @@ def plot_arctic_map(currently_frozen, newly_frozen, grid_size=100):
     matplotlib.figure.Figure
         Matplotlib figure containing the Arctic map
     """
+    # Deferred import so pages using only the plotly helpers don't pay
+    # matplotlib's import cost
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import to_rgb
+
     # Create a simplified Arctic map visualization
     # In a real application, you would use actual geographical data
-    
-    # Create a circular mask to represent the Arctic Ocean
-    y, x = np.ogrid[-grid_size//2:grid_size//2, -grid_size//2:grid_size//2]
-    mask = x**2 + y**2 <= (grid_size//2)**2
-    
+
+    # Circular mask representing the Arctic Ocean, cached per grid size
+    mask = _arctic_mask(grid_size)
+
     # Create a figure and axis
     fig, ax = plt.subplots(figsize=(10, 10))
-    
-    # Plot the base map (ocean)
-    ax.imshow(np.ones((grid_size, grid_size))*0.8, cmap='Blues', vmin=0, vmax=1)
-    
-    # Plot currently frozen areas
-    frozen_map = np.zeros((grid_size, grid_size))
-    frozen_map[currently_frozen & mask] = 1
-    ax.imshow(frozen_map, cmap='Greys', alpha=0.7, vmin=0, vmax=1)
-    
-    # Plot newly frozen areas
-    new_frozen_map = np.zeros((grid_size, grid_size))
-    new_frozen_map[newly_frozen & mask] = 1
-    ax.imshow(new_frozen_map, cmap='Greens', alpha=0.7, vmin=0, vmax=1)
+
+    # Compose one RGB image in NumPy and hand the backend a single
+    # imshow, instead of three full-grid layers alpha-blended by
+    # matplotlib. The frozen colors are pre-blended over the ocean color
+    # at the alpha the layered version used.
+    ocean = np.array(to_rgb('lightblue'), dtype=np.float32)
+    frozen_color = 0.7 * np.array(to_rgb('lightgrey'), dtype=np.float32) + 0.3 * ocean
+    newly_color = 0.7 * np.array(to_rgb('lightgreen'), dtype=np.float32) + 0.3 * ocean
+
+    rgb = np.empty((grid_size, grid_size, 3), dtype=np.float32)
+    rgb[:] = ocean
+    # One boolean scratch buffer serves both selections; the second
+    # logical_and writes into it in place instead of allocating again
+    sel = np.logical_and(currently_frozen, mask)
+    rgb[sel] = frozen_color
+    np.logical_and(newly_frozen, mask, out=sel)
+    rgb[sel] = newly_color
+    ax.imshow(rgb)
     
     # Add legend elements
     from matplotlib.patches import Patch
@@ -173,6 +191,7 @@ def plot_arctic_map(currently_frozen, newly_frozen, grid_size=100):
     
     return fig
 
+@st.cache_resource(show_spinner=False)
 def plot_geoengineering_comparison():
     """
     Create a comparison chart of different geoengineering approaches.
@@ -188,42 +207,31 @@ def plot_geoengineering_comparison():
     # Get approaches from database
     approaches_data = get_geoengineering_approaches()
     
-    # Create lists to store data
-    approaches = []
-    effectiveness = []
-    feasibility = []
-    cost_efficiency = []
-    environmental_impact = []
-    technological_readiness = []
-    scalability = []
-    
-    # Extract data from database results
-    for approach in approaches_data:
-        approaches.append(approach['name'])
-        effectiveness.append(approach['effectiveness'])
-        feasibility.append(approach['feasibility'])
-        cost_efficiency.append(approach['cost_efficiency'])
-        environmental_impact.append(approach['environmental_impact'])
-        technological_readiness.append(approach['technological_readiness'])
-        scalability.append(approach['scalability'])
-    
+    # One (approaches x metrics) matrix instead of six parallel lists
+    # appended row by row; each radar vector is then a contiguous slice
+    metric_keys = ('effectiveness', 'feasibility', 'cost_efficiency',
+                   'environmental_impact', 'technological_readiness',
+                   'scalability')
+    names = [a['name'] for a in approaches_data]
+    metrics = np.array([[a[k] for k in metric_keys] for a in approaches_data])
+
     # Create the plot
     fig = go.Figure()
-    
+
     # Define categories for the radar chart
-    categories = ['Effectiveness', 'Feasibility', 'Cost Efficiency', 
+    categories = ['Effectiveness', 'Feasibility', 'Cost Efficiency',
                  'Environmental Impact', 'Tech Readiness', 'Scalability']
-    
-    # Add traces for each approach
-    for i, approach in enumerate(approaches):
+    theta = categories + [categories[0]]
+
+    # Add traces for each approach, repeating the first point to close
+    # the radar loop
+    for name, row in zip(names, metrics):
         fig.add_trace(
             go.Scatterpolar(
-                r=[effectiveness[i], feasibility[i], cost_efficiency[i], 
-                   environmental_impact[i], technological_readiness[i], 
-                   scalability[i], effectiveness[i]],  # Close the loop by repeating the first point
-                theta=categories + [categories[0]],
+                r=np.concatenate([row, row[:1]]),
+                theta=theta,
                 fill='toself',
-                name=approach
+                name=name
             )
         )
     
@@ -241,6 +249,7 @@ def plot_geoengineering_comparison():
     
     return fig
 
+@st.cache_resource(show_spinner=False)
 def plot_ice_albedo_feedback():
     """
     Create a visualization of the ice-albedo feedback loop.
@@ -261,19 +270,18 @@ def plot_ice_albedo_feedback():
     # Create the plot
     fig = go.Figure()
     
-    # Add nodes
-    for node, pos in nodes.items():
-        fig.add_trace(
-            go.Scatter(
-                x=[pos["x"]], 
-                y=[pos["y"]],
-                mode='markers+text',
-                marker=dict(size=30, color='lightblue'),
-                text=node,
-                textposition="middle center",
-                name=node
-            )
+    # Add all nodes as one Scatter trace: one SVG group and a smaller
+    # figure payload instead of four single-point marker traces
+    fig.add_trace(
+        go.Scatter(
+            x=[pos["x"] for pos in nodes.values()],
+            y=[pos["y"] for pos in nodes.values()],
+            mode='markers+text',
+            marker=dict(size=30, color='lightblue'),
+            text=list(nodes),
+            textposition="middle center"
         )
+    )
     
     # Add arrows
     arrows = [